@@ -1,34 +1,159 @@
 
 from __future__ import annotations
 
+import calendar
+import glob
+import gzip
+import hashlib
+import json
 import os
+import re
+import shutil
 import sqlite3
-from datetime import datetime
+import tempfile
+import threading
+import time
+import zlib
+from datetime import date, datetime, timedelta, timezone
+from difflib import SequenceMatcher
+from collections import OrderedDict
+from contextlib import contextmanager
+from email.utils import format_datetime
 from functools import wraps
-from typing import Dict, List, Optional
+from itertools import chain
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit
+from xml.sax.saxutils import escape, quoteattr
 
+import click
 from flask import (
     Flask,
+    Response,
     abort,
     flash,
     g,
+    get_flashed_messages,
     redirect,
     render_template,
     request,
+    send_file,
     send_from_directory,
     session,
+    stream_template,
+    stream_with_context,
     url_for,
 )
+from flask.cli import AppGroup
+from markupsafe import Markup
+from PIL import Image, ImageOps
+from werkzeug.middleware.proxy_fix import ProxyFix
 from werkzeug.security import check_password_hash, generate_password_hash
+from werkzeug.utils import safe_join
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_DIR = os.path.join(BASE_DIR, "data")
 DB_PATH = os.path.join(DATA_DIR, "app.db")
+IMAGES_DIR = os.path.join(BASE_DIR, "images")
+IMAGE_CACHE_DIR = os.path.join(DATA_DIR, "image_cache")
+IMAGE_CACHE_MAX_BYTES = int(os.environ.get("IMAGE_CACHE_MAX_MB", "512")) * 1024 * 1024
+BACKUP_DIR = os.environ.get("BACKUP_DIR", os.path.join(DATA_DIR, "backups"))
+BACKUP_KEEP = int(os.environ.get("BACKUP_KEEP", "14"))
+SHED_QUEUE_DEADLINE = float(os.environ.get("SHED_QUEUE_DEADLINE_MS", "2000")) / 1000
+SHED_PRIORITY_QUEUE_DEADLINE = float(os.environ.get("SHED_PRIORITY_QUEUE_DEADLINE_MS", "10000")) / 1000
+# Ліміт одночасних запитів на один воркер. Має сенс лише з потоковими воркерами (gunicorn gthread,
+# див. Dockerfile), у яких потоків більше за ліміт: sync-воркер обробляє один запит і до ліміту не дійде
+SHED_MAX_INFLIGHT = int(os.environ.get("SHED_MAX_INFLIGHT", "8"))
+SHED_RETRY_AFTER = 5
+SHED_PRIORITY_PREFIXES = ("/admin", "/login", "/logout")
+STALE_CACHE_ENTRIES = 200
+STALE_ENTRY_MAX_BYTES = 512 * 1024
+STALE_CACHE_MAX_BYTES = 8 * 1024 * 1024
+# Базова адреса для абсолютних посилань у стрічках і мапі сайту; без неї береться Host запиту
+SITE_URL = os.environ.get("SITE_URL", "").rstrip("/")
+EXTERNAL_CACHE_HOSTS = 4
+# Підвищувати разом зі змінами схеми в init_db: /readyz порівнює його з PRAGMA user_version
+SCHEMA_VERSION = 2
+STARTED_AT = time.time()
 
 DEFAULT_OWNER_USERNAME = "owner"
 DEFAULT_OWNER_PASSWORD = "owner1234"
-
+PASSWORD_HASH_METHOD = os.environ.get("PASSWORD_HASH_METHOD", "scrypt")
+# (ключ-префікс, місткість, поповнення токенів за секунду)
+# Кошик "user" рахується окремо для кожної IP: чужі невдалі спроби не блокують власника облікового
+# запису, а розподілений перебір з багатьох адрес стримує кошик "global"
+LOGIN_RATE_LIMITS = [
+    ("ip", 10, 10 / 60),
+    ("user", 5, 5 / 300),
+    ("global", 20, 4),
+]
+LOGIN_BUCKET_TTL = 3600
+# Кількість зворотних проксі перед застосунком; лише їхнім X-Forwarded-For/Proto можна довіряти
+TRUSTED_PROXIES = int(os.environ.get("TRUSTED_PROXIES", "0"))
+
+LOCALES = ["uk", "en"]
+DEFAULT_LOCALE = "uk"
+TRANSLATION_LOCALES = [locale for locale in LOCALES if locale != DEFAULT_LOCALE]
 ARTICLE_CATEGORIES = ["Оголошення", "Подія", "Новина", "Інше"]
+ARTICLE_STATUSES = [("draft", "Чернетка"), ("scheduled", "Заплановано"), ("published", "Опубліковано")]
+SCHEDULER_INTERVAL = 60
+REVISION_FIELDS = [
+    "title",
+    "summary",
+    "content",
+    "category",
+    "section_id",
+    "published_date",
+    "event_date",
+    "external_link",
+    "status",
+    "publish_at",
+]
+REVISION_DIFF_FIELDS = {"summary", "content"}
+REVISION_SNAPSHOT_INTERVAL = 10
+REVISION_RETENTION_DAYS = 180
+REVISION_KEEP_MIN = 5
+AUDIT_RETENTION_DAYS = 365
+AUDIT_PAGE_SIZE = 200
+EVENT_VIEWS = ["month", "week"]
+EVENT_MIN_DATE = date(1900, 1, 1)
+EVENT_MAX_DATE = date(2100, 12, 31)
+UKR_MONTHS = [
+    "Січень",
+    "Лютий",
+    "Березень",
+    "Квітень",
+    "Травень",
+    "Червень",
+    "Липень",
+    "Серпень",
+    "Вересень",
+    "Жовтень",
+    "Листопад",
+    "Грудень",
+]
+UKR_WEEKDAYS = ["Пн", "Вт", "Ср", "Чт", "Пт", "Сб", "Нд"]
+ICS_PAST_DAYS = 30
+FEED_LIMIT = 50
+STREAM_CHUNK_SIZE = 16 * 1024
+CACHE_SCOPES = ["articles", "menu"]
+LOCALIZED_MIMETYPES = {
+    "text/html",
+    "application/rss+xml",
+    "application/atom+xml",
+    "application/xml",
+    "text/calendar",
+}
+# (ширина, висота); висота 0 — масштабування зі збереженням пропорцій
+IMAGE_SIZES = [(160, 0), (320, 0), (640, 0), (960, 0), (1280, 0), (1920, 0), (160, 160), (320, 320)]
+IMAGE_CONTENT_WIDTHS = [320, 640, 960, 1280, 1920]
+# Ширина тексту статті: контейнер 1200px мінус поля; на телефоні — уся ширина екрана
+IMAGE_CONTENT_SIZES = "(max-width: 1240px) calc(100vw - 5rem), 1150px"
+IMAGE_WARM_SIZES = [(320, 0), (640, 0), (1280, 0)]
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp", ".gif"}
+IMAGE_QUALITY = 80
+CONTENT_IMAGE_RE = re.compile(r"^\s*/?images/(\S+)\s*$")
+IMAGE_VERSION_LENGTH = 12
+IMAGE_UNVERSIONED_MAX_AGE = 3600
 UKR_SLUG_MAP = {
     "а": "a",
     "б": "b",
@@ -72,6 +197,248 @@ app = Flask(__name__, template_folder="templates", static_folder="static")
 app.secret_key = os.environ.get("FLASK_SECRET_KEY", "change-this-secret")
 
 
+class LocalePrefixMiddleware:
+    # /en/... і /uk/... обслуговуються тими самими маршрутами; префікс переходить у SCRIPT_NAME,
+    # тому url_for сам додає його до всіх посилань
+    def __init__(self, wsgi_app):
+        self.wsgi_app = wsgi_app
+
+    def __call__(self, environ, start_response):
+        path = environ.get("PATH_INFO", "")
+        for locale in LOCALES:
+            prefix = f"/{locale}"
+            if path == prefix or path.startswith(prefix + "/"):
+                environ["PATH_INFO"] = path[len(prefix) :] or "/"
+                environ["SCRIPT_NAME"] = environ.get("SCRIPT_NAME", "") + prefix
+                environ["app.locale"] = locale
+                break
+        return self.wsgi_app(environ, start_response)
+
+
+app.wsgi_app = LocalePrefixMiddleware(app.wsgi_app)
+if TRUSTED_PROXIES:
+    # Інакше всі клієнти за проксі мають одну remote_addr і ділять один кошик входу "ip"
+    app.wsgi_app = ProxyFix(app.wsgi_app, x_for=TRUSTED_PROXIES, x_proto=TRUSTED_PROXIES)
+
+
+def parse_request_start(value: str) -> Optional[float]:
+    # X-Request-Start від проксі: "t=<секунди|мілісекунди|мікросекунди>"
+    try:
+        stamp = float(value.strip().removeprefix("t="))
+    except ValueError:
+        return None
+    if stamp > 1e14:
+        return stamp / 1_000_000
+    if stamp > 1e11:
+        return stamp / 1000
+    return stamp
+
+
+class LoadSheddingMiddleware:
+    def __init__(self, wsgi_app):
+        self.wsgi_app = wsgi_app
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.shed_count = 0
+        self.stale_served = 0
+        self.stale: "OrderedDict[tuple, Tuple[str, list, bytes]]" = OrderedDict()
+        self.stale_bytes = 0
+
+    def __call__(self, environ, start_response):
+        path = environ.get("PATH_INFO", "")
+        for locale in LOCALES:
+            if path.startswith(f"/{locale}/"):
+                path = path[len(locale) + 1 :]
+                break
+        priority = path.startswith(SHED_PRIORITY_PREFIXES)
+
+        queued = None
+        request_start = parse_request_start(environ.get("HTTP_X_REQUEST_START", ""))
+        if request_start is not None:
+            queued = time.time() - request_start
+        deadline = SHED_PRIORITY_QUEUE_DEADLINE if priority else SHED_QUEUE_DEADLINE
+
+        with self.lock:
+            overloaded = (queued is not None and queued > deadline) or (
+                not priority and SHED_MAX_INFLIGHT and self.in_flight >= SHED_MAX_INFLIGHT
+            )
+            if not overloaded:
+                self.in_flight += 1
+        if overloaded:
+            return self.shed(environ, start_response)
+
+        stale_key = self.stale_key(environ)
+        captured: Dict[str, object] = {}
+
+        def capture_start_response(status, headers, exc_info=None):
+            captured["status"] = status
+            captured["headers"] = headers
+            return start_response(status, headers, exc_info)
+
+        try:
+            body = self.wsgi_app(environ, capture_start_response)
+        except BaseException:
+            self.finish()
+            raise
+        return TrackedBody(self, body, stale_key, captured)
+
+    def remember(self, stale_key: tuple, captured: Dict[str, object], body: bytes) -> None:
+        if not self.storable(captured):
+            return
+        with self.lock:
+            previous = self.stale.pop(stale_key, None)
+            if previous is not None:
+                self.stale_bytes -= len(previous[2])
+            self.stale[stale_key] = (captured["status"], list(captured["headers"]), body)
+            self.stale_bytes += len(body)
+            while len(self.stale) > STALE_CACHE_ENTRIES or self.stale_bytes > STALE_CACHE_MAX_BYTES:
+                _key, (_status, _headers, evicted) = self.stale.popitem(last=False)
+                self.stale_bytes -= len(evicted)
+
+    def finish(self) -> None:
+        with self.lock:
+            self.in_flight -= 1
+
+    @staticmethod
+    def stale_key(environ) -> Optional[tuple]:
+        # Лише анонімні GET: сторінки для авторизованих містять персональні дані
+        if environ.get("REQUEST_METHOD") != "GET" or "session=" in environ.get("HTTP_COOKIE", ""):
+            return None
+        return (
+            environ.get("SCRIPT_NAME", ""),
+            environ.get("PATH_INFO", ""),
+            environ.get("QUERY_STRING", ""),
+            environ.get("HTTP_ACCEPT_LANGUAGE", ""),
+        )
+
+    @staticmethod
+    def storable(captured: Dict[str, object]) -> bool:
+        if not str(captured.get("status", "")).startswith("200"):
+            return False
+        headers = {name.lower(): value for name, value in captured.get("headers", [])}
+        if "set-cookie" in headers:
+            return False
+        # Ключ враховує лише Accept-Language; зображення й статика залежать від Accept (Vary),
+        # тому зберігаємо тільки сторінки та стрічки
+        return headers.get("content-type", "").split(";")[0].strip() in LOCALIZED_MIMETYPES
+
+    def shed(self, environ, start_response):
+        stale_key = self.stale_key(environ)
+        with self.lock:
+            entry = self.stale.get(stale_key) if stale_key is not None else None
+            if entry is not None:
+                self.stale_served += 1
+            else:
+                self.shed_count += 1
+        if entry is not None:
+            status, headers, body = entry
+            headers = [(name, value) for name, value in headers if name.lower() != "cache-control"]
+            headers += [("Cache-Control", "no-store"), ("X-Cache", "STALE")]
+            start_response(status, headers)
+            return [body]
+        body = "Сайт тимчасово перевантажений. Спробуйте за кілька секунд.".encode("utf-8")
+        start_response(
+            "503 Service Unavailable",
+            [
+                ("Content-Type", "text/plain; charset=utf-8"),
+                ("Content-Length", str(len(body))),
+                ("Retry-After", str(SHED_RETRY_AFTER)),
+                ("Cache-Control", "no-store"),
+            ],
+        )
+        return [body]
+
+
+class TrackedBody:
+    # close() викликається сервером завжди, навіть якщо тіло не читали, тож лічильник не "протікає"
+    def __init__(self, shedder: LoadSheddingMiddleware, body, stale_key: Optional[tuple], captured: Dict[str, object]):
+        self.shedder = shedder
+        self.body = body
+        self.stale_key = stale_key
+        self.captured = captured
+        self.chunks: List[bytes] = []
+        self.size = 0
+        self.complete = False
+
+    def __iter__(self):
+        for chunk in self.body:
+            if self.stale_key is not None and self.size <= STALE_ENTRY_MAX_BYTES:
+                self.chunks.append(chunk)
+                self.size += len(chunk)
+            yield chunk
+        self.complete = True
+
+    def close(self) -> None:
+        try:
+            if hasattr(self.body, "close"):
+                self.body.close()
+        finally:
+            self.shedder.finish()
+        if self.complete and self.stale_key is not None and self.size <= STALE_ENTRY_MAX_BYTES:
+            self.shedder.remember(self.stale_key, self.captured, b"".join(self.chunks))
+
+
+load_shedder = LoadSheddingMiddleware(app.wsgi_app)
+app.wsgi_app = load_shedder
+
+_probe = threading.local()
+
+
+def probe_connection() -> sqlite3.Connection:
+    # Постійне з'єднання на потік: проба не відкриває файл бази щоразу
+    conn = getattr(_probe, "conn", None)
+    if conn is None:
+        conn = sqlite3.connect(f"file:{DB_PATH}?mode=ro", uri=True, timeout=1)
+        _probe.conn = conn
+    return conn
+
+
+def check_readiness() -> Tuple[bool, str]:
+    try:
+        conn = probe_connection()
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+    except (OSError, sqlite3.Error) as error:
+        conn = getattr(_probe, "conn", None)
+        if conn is not None:
+            conn.close()
+        _probe.conn = None
+        return False, f"db: {error}"
+    if version != SCHEMA_VERSION:
+        return False, f"schema: {version} != {SCHEMA_VERSION}"
+    return True, "ok"
+
+
+class HealthCheckMiddleware:
+    # Проби оркестратора відповідаються до Flask і до обмеження навантаження:
+    # без сесії, шаблонів і планувальника, і їх ніколи не відкидають
+    def __init__(self, wsgi_app):
+        self.wsgi_app = wsgi_app
+
+    def __call__(self, environ, start_response):
+        path = environ.get("PATH_INFO", "")
+        if path == "/healthz":
+            return self.respond(start_response, True, "ok")
+        if path == "/readyz":
+            return self.respond(start_response, *check_readiness())
+        return self.wsgi_app(environ, start_response)
+
+    @staticmethod
+    def respond(start_response, ok: bool, message: str):
+        body = message.encode("utf-8")
+        start_response(
+            "200 OK" if ok else "503 Service Unavailable",
+            [
+                ("Content-Type", "text/plain; charset=utf-8"),
+                ("Content-Length", str(len(body))),
+                ("Cache-Control", "no-store"),
+            ],
+        )
+        return [body]
+
+
+app.wsgi_app = HealthCheckMiddleware(app.wsgi_app)
+
+
 def get_db() -> sqlite3.Connection:
     if "db" not in g:
         conn = sqlite3.connect(DB_PATH)
@@ -87,11 +454,22 @@ def close_db(exception: Optional[BaseException]) -> None:
         db.close()
 
 
+def hash_password(password: str) -> str:
+    return generate_password_hash(password, method=PASSWORD_HASH_METHOD)
+
+
+# Хеш-заглушка для невідомих логінів: перевірка коштує стільки ж, скільки для справжнього
+DUMMY_PASSWORD_HASH = hash_password(os.urandom(16).hex())
+PASSWORD_HASH_PREFIX = DUMMY_PASSWORD_HASH.split("$", 1)[0]
+
+
 def init_db() -> None:
     os.makedirs(DATA_DIR, exist_ok=True)
     conn = sqlite3.connect(DB_PATH)
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
+    # У WAL читачі не блокують запис: потокова сторінка з відкритим курсором не зупиняє збереження
+    cursor.execute("PRAGMA journal_mode=WAL")
 
     cursor.execute(
         """
@@ -137,6 +515,102 @@ def init_db() -> None:
         """
     )
 
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS cache_versions (
+          scope TEXT PRIMARY KEY,
+          version INTEGER NOT NULL DEFAULT 0
+        )
+        """
+    )
+
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS login_buckets (
+          key TEXT PRIMARY KEY,
+          tokens REAL NOT NULL,
+          updated_at REAL NOT NULL
+        )
+        """
+    )
+
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS article_redirects (
+          slug TEXT PRIMARY KEY,
+          article_id INTEGER NOT NULL,
+          FOREIGN KEY(article_id) REFERENCES articles(id)
+        )
+        """
+    )
+
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS article_revisions (
+          id INTEGER PRIMARY KEY AUTOINCREMENT,
+          article_id INTEGER NOT NULL,
+          revision INTEGER NOT NULL,
+          is_snapshot INTEGER NOT NULL,
+          payload BLOB NOT NULL,
+          user_id INTEGER,
+          created_at TEXT NOT NULL,
+          UNIQUE(article_id, revision)
+        )
+        """
+    )
+
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS audit_log (
+          id INTEGER PRIMARY KEY AUTOINCREMENT,
+          user_id INTEGER,
+          username TEXT,
+          action TEXT NOT NULL,
+          entity_type TEXT NOT NULL,
+          entity_id INTEGER,
+          details TEXT,
+          created_at TEXT NOT NULL
+        )
+        """
+    )
+
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS menu_item_translations (
+          menu_item_id INTEGER NOT NULL,
+          locale TEXT NOT NULL,
+          title TEXT NOT NULL,
+          PRIMARY KEY(menu_item_id, locale),
+          FOREIGN KEY(menu_item_id) REFERENCES menu_items(id)
+        )
+        """
+    )
+
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS article_translations (
+          article_id INTEGER NOT NULL,
+          locale TEXT NOT NULL,
+          title TEXT NOT NULL,
+          summary TEXT,
+          content TEXT,
+          PRIMARY KEY(article_id, locale),
+          FOREIGN KEY(article_id) REFERENCES articles(id)
+        )
+        """
+    )
+
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_audit_log_user ON audit_log(user_id, created_at)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_audit_log_created_at ON audit_log(created_at)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_login_buckets_updated_at ON login_buckets(updated_at)")
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_articles_event_date ON articles(event_date) WHERE event_date IS NOT NULL"
+    )
+    cursor.executemany(
+        "INSERT OR IGNORE INTO cache_versions (scope, version) VALUES (?, 0)",
+        [(scope,) for scope in CACHE_SCOPES],
+    )
+
     cursor.execute("SELECT COUNT(*) FROM users")
     if cursor.fetchone()[0] == 0:
         cursor.execute(
@@ -146,7 +620,7 @@ def init_db() -> None:
             """,
             (
                 DEFAULT_OWNER_USERNAME,
-                generate_password_hash(DEFAULT_OWNER_PASSWORD),
+                hash_password(DEFAULT_OWNER_PASSWORD),
                 "owner",
                 datetime.utcnow().isoformat(),
             ),
@@ -251,23 +725,88 @@ def init_db() -> None:
         )
 
     ensure_menu_urls(cursor)
+    ensure_article_slugs(cursor)
+    ensure_article_status(cursor)
+    cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
 
     conn.commit()
     conn.close()
 
 
 def slugify_uk(text: str) -> str:
-    text = text.strip().lower()
-    result = []
-    for ch in text:
+    result: List[str] = []
+    for ch in text.strip().lower():
         if ch.isalnum():
-            result.append(UKR_SLUG_MAP.get(ch, ch))
+            piece = UKR_SLUG_MAP.get(ch, ch)
         elif ch.isspace() or ch in {"-", "_"}:
-            result.append("-")
-    slug = "".join(result)
-    while "--" in slug:
-        slug = slug.replace("--", "-")
-    return slug.strip("-")
+            # Дефіси згортаються одразу, без повторних проходів по рядку
+            if not result or result[-1] == "-":
+                continue
+            piece = "-"
+        else:
+            continue
+        if piece:
+            result.append(piece)
+    return "".join(result).strip("-")
+
+
+def unique_article_slug(cursor: sqlite3.Cursor, title: str, exclude_id: Optional[int] = None) -> str:
+    base = slugify_uk(title)
+    # Числові слаги перехоплював би маршрут /articles/<int:article_id>
+    if not base or base.isdigit():
+        base = f"article-{base}".strip("-")
+    cursor.execute(
+        "SELECT slug FROM articles WHERE (slug = ? OR (slug >= ? AND slug < ?)) AND id IS NOT ?",
+        (base, f"{base}-", f"{base}.", exclude_id),
+    )
+    taken = {row[0] for row in cursor.fetchall()}
+    if base not in taken:
+        return base
+    suffix = 2
+    while f"{base}-{suffix}" in taken:
+        suffix += 1
+    return f"{base}-{suffix}"
+
+
+def ensure_column(cursor: sqlite3.Cursor, table: str, column: str, definition: str) -> None:
+    columns = {row[1] for row in cursor.execute(f"PRAGMA table_info({table})").fetchall()}
+    if column not in columns:
+        cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
+
+def ensure_article_slugs(cursor: sqlite3.Cursor) -> None:
+    ensure_column(cursor, "articles", "slug", "TEXT")
+    cursor.execute("SELECT id, title FROM articles WHERE slug IS NULL ORDER BY id")
+    for row in cursor.fetchall():
+        cursor.execute(
+            "UPDATE articles SET slug = ? WHERE id = ?",
+            (unique_article_slug(cursor, row["title"]), row["id"]),
+        )
+    cursor.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_articles_slug ON articles(slug)")
+
+
+def ensure_article_status(cursor: sqlite3.Cursor) -> None:
+    ensure_column(cursor, "articles", "status", "TEXT NOT NULL DEFAULT 'published'")
+    ensure_column(cursor, "articles", "publish_at", "TEXT")
+    # Часткові індекси містять лише видимі рядки, тож фільтр status нічого не коштує публічним сторінкам
+    cursor.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_articles_visible_section
+        ON articles(section_id, published_date DESC) WHERE status = 'published'
+        """
+    )
+    cursor.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_articles_visible_category
+        ON articles(category, published_date DESC) WHERE status = 'published'
+        """
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_articles_scheduled ON articles(publish_at) WHERE status = 'scheduled'"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_articles_published_date ON articles(published_date DESC)"
+    )
 
 
 def ensure_menu_urls(cursor: sqlite3.Cursor) -> None:
@@ -331,15 +870,201 @@ def query_db(query: str, args: tuple = (), one: bool = False):
     return rows
 
 
+LOCALIZED_ARTICLES_SELECT = """
+    SELECT articles.id, articles.slug,
+           COALESCE(tr.title, articles.title) AS title,
+           COALESCE(tr.summary, articles.summary) AS summary,
+           COALESCE(tr.content, articles.content) AS content,
+           articles.category, articles.section_id, articles.published_date, articles.event_date,
+           articles.external_link, articles.status, articles.publish_at, articles.created_at, articles.updated_at,
+           COALESCE(mt.title, menu_items.title) AS section_title
+    FROM articles
+    LEFT JOIN article_translations AS tr ON tr.article_id = articles.id AND tr.locale = ?
+    LEFT JOIN menu_items ON menu_items.id = articles.section_id
+    LEFT JOIN menu_item_translations AS mt ON mt.menu_item_id = menu_items.id AND mt.locale = ?
+"""
+
+
+# Для списків: без content, який шаблони списків не показують
+LOCALIZED_ARTICLE_LIST_SELECT = """
+    SELECT articles.id, articles.slug,
+           COALESCE(tr.title, articles.title) AS title,
+           COALESCE(tr.summary, articles.summary) AS summary,
+           articles.category, articles.section_id, articles.published_date, articles.event_date,
+           COALESCE(mt.title, menu_items.title) AS section_title
+    FROM articles
+    LEFT JOIN article_translations AS tr ON tr.article_id = articles.id AND tr.locale = ?
+    LEFT JOIN menu_items ON menu_items.id = articles.section_id
+    LEFT JOIN menu_item_translations AS mt ON mt.menu_item_id = menu_items.id AND mt.locale = ?
+"""
+
+
+def locale_params() -> tuple:
+    return (g.locale, g.locale)
+
+
+def batch_chunks(chunks: Iterator[str], size: int = STREAM_CHUNK_SIZE) -> Iterator[str]:
+    # Шаблон віддає десятки байтів за раз; дрібні шматки тримають воркер довше, ніж сам рендер
+    buffer: List[str] = []
+    buffered = 0
+    try:
+        for chunk in chunks:
+            buffer.append(chunk)
+            buffered += len(chunk)
+            if buffered >= size:
+                yield "".join(buffer)
+                buffer = []
+                buffered = 0
+        if buffer:
+            yield "".join(buffer)
+    finally:
+        if hasattr(chunks, "close"):
+            chunks.close()
+
+
+def iter_db(query: str, args: tuple = ()) -> Iterator[sqlite3.Row]:
+    cursor = get_db().execute(query, args)
+    try:
+        yield from cursor
+    finally:
+        cursor.close()
+
+
 def execute_db(query: str, args: tuple = ()) -> int:
     db = get_db()
     cursor = db.execute(query, args)
-    db.commit()
+    if not g.get("in_transaction"):
+        db.commit()
     last_id = cursor.lastrowid
     cursor.close()
     return last_id
 
 
+@contextmanager
+def db_transaction() -> Iterator[sqlite3.Connection]:
+    # Усередині блоку execute_db не комітить: зміни, ревізія й аудит записуються разом або ніяк
+    db = get_db()
+    db.execute("BEGIN IMMEDIATE")
+    g.in_transaction = True
+    try:
+        yield db
+        db.commit()
+    except BaseException:
+        db.rollback()
+        raise
+    finally:
+        g.in_transaction = False
+
+
+_cache: Dict[Tuple[str, ...], Tuple[tuple, Dict[tuple, object]]] = {}
+_cache_stats: Dict[Tuple[str, ...], Dict[str, int]] = {}
+
+
+def get_cache_versions(scopes: Tuple[str, ...]) -> tuple:
+    rows = query_db("SELECT scope, version FROM cache_versions")
+    versions = {row["scope"]: row["version"] for row in rows}
+    return tuple(versions.get(scope, 0) for scope in scopes)
+
+
+def bump_cache_version(scope: str) -> None:
+    execute_db("UPDATE cache_versions SET version = version + 1 WHERE scope = ?", (scope,))
+
+
+def cache_entries(scopes: Tuple[str, ...], versions: tuple) -> Dict[tuple, object]:
+    # Версії зберігаються в БД, тож запис в одному воркері скидає кеш в усіх інших
+    cached_versions, entries = _cache.get(scopes, (None, {}))
+    if cached_versions != versions:
+        entries = {}
+        _cache[scopes] = (versions, entries)
+    return entries
+
+
+def count_cache_lookup(scopes: Tuple[str, ...], hit: bool) -> None:
+    stats = _cache_stats.setdefault(scopes, {"hits": 0, "misses": 0})
+    stats["hits" if hit else "misses"] += 1
+
+
+def cached(scopes: Tuple[str, ...], key: tuple, builder: Callable[[], object]):
+    key = key + (g.get("locale", DEFAULT_LOCALE),)
+    entries = cache_entries(scopes, get_cache_versions(scopes))
+    count_cache_lookup(scopes, key in entries)
+    if key not in entries:
+        entries[key] = builder()
+    return entries[key]
+
+
+def cached_stream(
+    scopes: Tuple[str, ...],
+    key: tuple,
+    generate: Callable[[], Iterator[str]],
+    mimetype: str,
+    max_age: int = 300,
+) -> Response:
+    key = key + (g.get("locale", DEFAULT_LOCALE),)
+    versions = get_cache_versions(scopes)
+    etag = hashlib.sha1(repr((scopes, versions, key)).encode("utf-8")).hexdigest()
+    if request.if_none_match.contains(etag):
+        count_cache_lookup(scopes, True)
+        response = Response(status=304)
+    else:
+        entries = cache_entries(scopes, versions)
+        body = entries.get(key)
+        count_cache_lookup(scopes, body is not None)
+        if body is not None:
+            response = Response(body, mimetype=mimetype)
+        else:
+
+            def tee() -> Iterator[str]:
+                chunks: List[str] = []
+                for chunk in generate():
+                    chunks.append(chunk)
+                    yield chunk
+                entries[key] = "".join(chunks)
+
+            response = Response(batch_chunks(stream_with_context(tee())), mimetype=mimetype)
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = max_age
+    return response
+
+
+def evict_cached(scopes: Tuple[str, ...], keep: Callable[[tuple], bool]) -> None:
+    _versions, entries = _cache.get(scopes, (None, {}))
+    for key in [key for key in entries if not keep(key)]:
+        del entries[key]
+
+
+def site_root() -> str:
+    return SITE_URL or request.host_url.rstrip("/")
+
+
+def external_url(endpoint: str, **values) -> str:
+    return site_root() + url_for(endpoint, **values)
+
+
+_external_hosts: "OrderedDict[str, None]" = OrderedDict()
+_external_hosts_lock = threading.Lock()
+
+
+def external_cache_key(key: tuple) -> tuple:
+    # Без SITE_URL посилання залежать від Host, який надсилає клієнт: кешуємо лише кілька
+    # останніх хостів, а записи витісненого хоста видаляємо, тож пам'ять обмежена
+    if SITE_URL:
+        return key
+    host = request.host.lower()
+    with _external_hosts_lock:
+        _external_hosts[host] = None
+        _external_hosts.move_to_end(host)
+        evicted = []
+        while len(_external_hosts) > EXTERNAL_CACHE_HOSTS:
+            evicted.append(_external_hosts.popitem(last=False)[0])
+    for old_host in evicted:
+        for scopes in list(_cache):
+            # Локаль додається до ключа останньою, хост — перед нею
+            evict_cached(scopes, lambda cached_key: cached_key[-2:-1] != (old_host,))
+    return key + (host,)
+
+
 def build_menu_tree(rows: List[sqlite3.Row]) -> List[dict]:
     items: Dict[int, dict] = {}
     roots: List[dict] = []
@@ -370,13 +1095,27 @@ def build_menu_tree(rows: List[sqlite3.Row]) -> List[dict]:
     return sort_items(roots)
 
 
-def get_menu_tree() -> List[dict]:
-    rows = query_db("SELECT * FROM menu_items ORDER BY sort_order, title")
+def load_menu_tree(locale: str) -> List[dict]:
+    rows = query_db(
+        """
+        SELECT menu_items.id, menu_items.parent_id, COALESCE(mt.title, menu_items.title) AS title,
+               menu_items.url, menu_items.sort_order
+        FROM menu_items
+        LEFT JOIN menu_item_translations AS mt ON mt.menu_item_id = menu_items.id AND mt.locale = ?
+        """,
+        (locale,),
+    )
     return build_menu_tree(rows)
 
 
-def get_menu_flat() -> List[dict]:
-    tree = get_menu_tree()
+def get_menu_tree(locale: Optional[str] = None) -> List[dict]:
+    locale = locale or g.get("locale", DEFAULT_LOCALE)
+    # Дерево будується один раз на мову й версію меню, а не на кожен запит
+    return cached(("menu",), ("menu_tree", locale), lambda: load_menu_tree(locale))
+
+
+def get_menu_flat(locale: Optional[str] = None) -> List[dict]:
+    tree = get_menu_tree(locale)
     flat: List[dict] = []
 
     def walk(nodes: List[dict], level: int = 0) -> None:
@@ -422,9 +1161,63 @@ def inject_globals():
     return {
         "menu_items": get_menu_tree(),
         "current_user": g.get("user"),
+        "locale": g.get("locale", DEFAULT_LOCALE),
+        "locales": LOCALES,
+        "image_url": image_url,
+        "locale_url": locale_url,
     }
 
 
+def locale_url(locale: str) -> str:
+    # Та сама сторінка з тими самими параметрами запиту, але з іншим мовним префіксом
+    script_root = request.script_root
+    current = request.environ.get("app.locale")
+    if current:
+        script_root = script_root[: -len(current) - 1]
+    url = f"{script_root}/{locale}{request.path}"
+    query = request.query_string.decode("utf-8", "replace")
+    return f"{url}?{query}" if query else url
+
+
+@app.before_request
+def select_locale():
+    g.locale = request.environ.get("app.locale") or request.accept_languages.best_match(LOCALES) or DEFAULT_LOCALE
+
+
+@app.after_request
+def vary_on_language(response: Response) -> Response:
+    # Статика та зображення від мови не залежать — Vary лише розщеплював би їхній кеш
+    if "app.locale" not in request.environ and response.mimetype in LOCALIZED_MIMETYPES:
+        response.vary.add("Accept-Language")
+    return response
+
+
+def publish_due_articles() -> int:
+    db = get_db()
+    cursor = db.execute(
+        "UPDATE articles SET status = 'published', updated_at = ? WHERE status = 'scheduled' AND publish_at <= ?",
+        (datetime.utcnow().isoformat(), datetime.now().isoformat(timespec="minutes")),
+    )
+    db.commit()
+    published = cursor.rowcount
+    cursor.close()
+    if published:
+        bump_cache_version("articles")
+    return published
+
+
+_scheduler_state = {"last_run": 0.0}
+
+
+@app.before_request
+def run_scheduler():
+    now = time.monotonic()
+    if now - _scheduler_state["last_run"] < SCHEDULER_INTERVAL:
+        return
+    _scheduler_state["last_run"] = now
+    publish_due_articles()
+
+
 @app.before_request
 def load_user():
     g.user = None
@@ -460,6 +1253,165 @@ def role_required(*roles):
     return decorator
 
 
+def audit(action: str, entity_type: str, entity_id: Optional[int], details: str = "") -> None:
+    execute_db(
+        """
+        INSERT INTO audit_log (user_id, username, action, entity_type, entity_id, details, created_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        """,
+        (
+            g.user["id"] if g.get("user") else None,
+            g.user["username"] if g.get("user") else None,
+            action,
+            entity_type,
+            entity_id,
+            details,
+            datetime.utcnow().isoformat(),
+        ),
+    )
+
+
+def article_state(row: sqlite3.Row) -> dict:
+    return {field: row[field] for field in REVISION_FIELDS}
+
+
+def diff_lines(old: str, new: str) -> List[list]:
+    old_lines = old.splitlines(keepends=True)
+    new_lines = new.splitlines(keepends=True)
+    matcher = SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+    return [
+        [i1, i2, new_lines[j1:j2]]
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+        if tag != "equal"
+    ]
+
+
+def patch_lines(old: str, ops: List[list]) -> str:
+    lines = old.splitlines(keepends=True)
+    for i1, i2, new_lines in reversed(ops):
+        lines[i1:i2] = new_lines
+    return "".join(lines)
+
+
+def encode_revision(previous: Optional[dict], state: dict) -> bytes:
+    if previous is None:
+        data = state
+    else:
+        # Дельта: змінені короткі поля цілком, довгі тексти — як порядкові правки
+        data = {"fields": {}, "diffs": {}}
+        for field in REVISION_FIELDS:
+            if state[field] == previous[field]:
+                continue
+            if field in REVISION_DIFF_FIELDS and previous[field] is not None and state[field] is not None:
+                data["diffs"][field] = diff_lines(previous[field], state[field])
+            else:
+                data["fields"][field] = state[field]
+    return zlib.compress(json.dumps(data, ensure_ascii=False).encode("utf-8"), 9)
+
+
+def load_article_revision(article_id: int, revision: int) -> Optional[dict]:
+    rows = query_db(
+        """
+        SELECT revision, is_snapshot, payload
+        FROM article_revisions
+        WHERE article_id = ? AND revision <= ? AND revision >= (
+          SELECT MAX(revision) FROM article_revisions
+          WHERE article_id = ? AND revision <= ? AND is_snapshot = 1
+        )
+        ORDER BY revision
+        """,
+        (article_id, revision, article_id, revision),
+    )
+    # Без рядка саме з цим номером запит повернув би стан останньої меншої ревізії
+    if not rows or rows[-1]["revision"] != revision:
+        return None
+    state: Optional[dict] = None
+    for row in rows:
+        data = json.loads(zlib.decompress(row["payload"]).decode("utf-8"))
+        if row["is_snapshot"]:
+            state = data
+            continue
+        state.update(data["fields"])
+        for field, ops in data["diffs"].items():
+            state[field] = patch_lines(state[field], ops)
+    return state
+
+
+def record_article_revision(article_id: int, state: dict, previous: Optional[dict] = None) -> None:
+    latest = query_db(
+        """
+        SELECT MAX(revision) AS revision,
+               MAX(CASE WHEN is_snapshot = 1 THEN revision END) AS snapshot_revision
+        FROM article_revisions
+        WHERE article_id = ?
+        """,
+        (article_id,),
+        one=True,
+    )
+    if latest["revision"] is None and previous is not None and previous != state:
+        # Стаття з'явилася до журналу ревізій — спершу зберігаємо її попередній стан
+        record_article_revision(article_id, previous)
+        record_article_revision(article_id, state)
+        return
+
+    revision = (latest["revision"] or 0) + 1
+    prev_state = load_article_revision(article_id, revision - 1) if latest["revision"] else None
+    if prev_state == state:
+        return
+    is_snapshot = prev_state is None or revision - latest["snapshot_revision"] >= REVISION_SNAPSHOT_INTERVAL
+    execute_db(
+        """
+        INSERT INTO article_revisions (article_id, revision, is_snapshot, payload, user_id, created_at)
+        VALUES (?, ?, ?, ?, ?, ?)
+        """,
+        (
+            article_id,
+            revision,
+            1 if is_snapshot else 0,
+            encode_revision(None if is_snapshot else prev_state, state),
+            g.user["id"] if g.get("user") else None,
+            datetime.utcnow().isoformat(),
+        ),
+    )
+
+
+def compact_article_revisions() -> Tuple[int, int]:
+    db = get_db()
+    cutoff = (datetime.utcnow() - timedelta(days=REVISION_RETENTION_DAYS)).isoformat()
+    removed = 0
+    article_ids = [
+        row["article_id"]
+        for row in query_db("SELECT DISTINCT article_id FROM article_revisions WHERE created_at < ?", (cutoff,))
+    ]
+    for article_id in article_ids:
+        revisions = query_db(
+            "SELECT revision, created_at FROM article_revisions WHERE article_id = ? ORDER BY revision",
+            (article_id,),
+        )
+        keep_index = next((idx for idx, row in enumerate(revisions) if row["created_at"] >= cutoff), len(revisions))
+        keep_index = min(keep_index, len(revisions) - REVISION_KEEP_MIN)
+        if keep_index <= 0:
+            continue
+        keep_revision = revisions[keep_index]["revision"]
+        # Найстаріша збережена ревізія стає повним знімком, щоб ланцюжок дельт не обривався
+        state = load_article_revision(article_id, keep_revision)
+        db.execute(
+            "UPDATE article_revisions SET is_snapshot = 1, payload = ? WHERE article_id = ? AND revision = ?",
+            (encode_revision(None, state), article_id, keep_revision),
+        )
+        cursor = db.execute(
+            "DELETE FROM article_revisions WHERE article_id = ? AND revision < ?",
+            (article_id, keep_revision),
+        )
+        removed += cursor.rowcount
+        db.commit()
+
+    audit_cutoff = (datetime.utcnow() - timedelta(days=AUDIT_RETENTION_DAYS)).isoformat()
+    cursor = db.execute("DELETE FROM audit_log WHERE created_at < ?", (audit_cutoff,))
+    db.commit()
+    return removed, cursor.rowcount
+
+
 def creatable_roles(user_role: str) -> List[str]:
     if user_role == "owner":
         return ["admin", "editor"]
@@ -479,14 +1431,13 @@ def can_manage_user(actor: sqlite3.Row, target: sqlite3.Row) -> bool:
 @app.route("/")
 def index():
     articles = query_db(
-        """
-        SELECT articles.*, menu_items.title AS section_title
-        FROM articles
-        LEFT JOIN menu_items ON menu_items.id = articles.section_id
-        WHERE articles.section_id IS NULL
+        LOCALIZED_ARTICLES_SELECT
+        + """
+        WHERE articles.status = 'published' AND articles.section_id IS NULL
         ORDER BY articles.published_date DESC
         LIMIT 3
-        """
+        """,
+        locale_params(),
     )
     return render_template("index.html", active_title="Головна", articles=articles)
 
@@ -505,7 +1456,16 @@ def page(slug: str):
     if os.path.isfile(file_path):
         with open(file_path, "r", encoding="utf-8") as handle:
             content = handle.read()
-    menu_item = query_db("SELECT title FROM menu_items WHERE url = ?", (f"/page/{slug}",), one=True)
+    menu_item = query_db(
+        """
+        SELECT COALESCE(mt.title, menu_items.title) AS title
+        FROM menu_items
+        LEFT JOIN menu_item_translations AS mt ON mt.menu_item_id = menu_items.id AND mt.locale = ?
+        WHERE menu_items.url = ?
+        """,
+        (g.locale, f"/page/{slug}"),
+        one=True,
+    )
     page_title = menu_item["title"] if menu_item else slug.replace("-", " ").title()
     return render_template(
         "page.html",
@@ -525,14 +1485,12 @@ def section(section_id: int):
     section_ids = get_descendant_ids(section_id)
     placeholders = ",".join("?" * len(section_ids))
     articles = query_db(
-        f"""
-        SELECT articles.*, menu_items.title AS section_title
-        FROM articles
-        LEFT JOIN menu_items ON menu_items.id = articles.section_id
-        WHERE articles.section_id IN ({placeholders})
+        LOCALIZED_ARTICLES_SELECT
+        + f"""
+        WHERE articles.status = 'published' AND articles.section_id IN ({placeholders})
         ORDER BY articles.published_date DESC
         """,
-        tuple(section_ids),
+        locale_params() + tuple(section_ids),
     )
     return render_template(
         "section.html",
@@ -542,40 +1500,49 @@ def section(section_id: int):
     )
 
 
+def iter_articles_by_category(
+    categories: List[str], section_id: str
+) -> Iterator[Tuple[str, Iterator[sqlite3.Row], bool]]:
+    # Окремий запит на категорію читає idx_articles_visible_category у порядку індексу,
+    # тож перший рядок приходить без сортування всього архіву
+    for category in categories:
+        query = (
+            LOCALIZED_ARTICLE_LIST_SELECT
+            + """
+            WHERE articles.status = 'published' AND articles.category = ?
+        """
+        )
+        params: List = list(locale_params()) + [category]
+        if section_id:
+            query += " AND articles.section_id = ?"
+            params.append(section_id)
+        query += " ORDER BY articles.published_date DESC"
+        rows = iter_db(query, tuple(params))
+        first = next(rows, None)
+        if first is not None:
+            yield category, chain([first], rows), True
+        elif len(categories) == 1:
+            yield category, iter(()), False
+
+
+def stream_listing(template_name: str, **context) -> Response:
+    # Флеш-повідомлення забираємо з сесії до відправки заголовків, інакше cookie вже не оновиться
+    get_flashed_messages(with_categories=True)
+    return Response(batch_chunks(stream_template(template_name, **context)))
+
+
 @app.route("/articles")
 def articles():
     category = request.args.get("category", "").strip()
     section_id = request.args.get("section_id", "").strip()
 
-    query = """
-        SELECT articles.*, menu_items.title AS section_title
-        FROM articles
-        LEFT JOIN menu_items ON menu_items.id = articles.section_id
-        WHERE 1 = 1
-    """
-    params: List = []
-    if category:
-        query += " AND articles.category = ?"
-        params.append(category)
-    if section_id:
-        query += " AND articles.section_id = ?"
-        params.append(section_id)
-
-    query += " ORDER BY articles.published_date DESC"
-    articles_list = query_db(query, tuple(params))
-
     categories_to_show = ARTICLE_CATEGORIES
     if category:
         categories_to_show = [category]
 
-    articles_by_category: Dict[str, List[sqlite3.Row]] = {cat: [] for cat in categories_to_show}
-    for item in articles_list:
-        if item["category"] in articles_by_category:
-            articles_by_category[item["category"]].append(item)
-
-    return render_template(
+    return stream_listing(
         "articles.html",
-        articles_by_category=articles_by_category,
+        articles_by_category=iter_articles_by_category(categories_to_show, section_id),
         categories=ARTICLE_CATEGORIES,
         sections=get_menu_flat(),
         selected_category=category,
@@ -584,30 +1551,411 @@ def articles():
     )
 
 
+def resolve_article_redirect(key: str, query: str, args: tuple) -> Optional[str]:
+    entries = cache_entries(("articles",), get_cache_versions(("articles",)))
+    slug = entries.get(("redirect", key))
+    if slug is None:
+        row = query_db(query, args, one=True)
+        if not row:
+            return None
+        # Слаг походить від назви, тож редирект на неопубліковану статтю розкрив би її назву
+        if row["status"] != "published":
+            return row["slug"] if g.user is not None else None
+        slug = row["slug"]
+        entries[("redirect", key)] = slug
+    return slug
+
+
 @app.route("/articles/<int:article_id>")
-def article_detail(article_id: int):
+def article_detail_by_id(article_id: int):
+    slug = resolve_article_redirect(
+        f"id:{article_id}", "SELECT slug, status FROM articles WHERE id = ?", (article_id,)
+    )
+    if not slug:
+        abort(404)
+    return redirect(url_for("article_detail", slug=slug), code=301)
+
+
+@app.route("/articles/<slug>")
+def article_detail(slug: str):
     article = query_db(
-        """
-        SELECT articles.*, menu_items.title AS section_title
-        FROM articles
-        LEFT JOIN menu_items ON menu_items.id = articles.section_id
-        WHERE articles.id = ?
+        LOCALIZED_ARTICLES_SELECT
+        + """
+        WHERE articles.slug = ?
         """,
-        (article_id,),
+        locale_params() + (slug,),
         one=True,
     )
-    if not article:
+    if article and article["status"] != "published" and g.user is None:
         abort(404)
+    if not article:
+        current_slug = resolve_article_redirect(
+            f"slug:{slug}",
+            """
+            SELECT articles.slug, articles.status
+            FROM article_redirects
+            JOIN articles ON articles.id = article_redirects.article_id
+            WHERE article_redirects.slug = ?
+            """,
+            (slug,),
+        )
+        if not current_slug:
+            abort(404)
+        return redirect(url_for("article_detail", slug=current_slug), code=301)
     return render_template("article_detail.html", article=article, active_title="")
 
 
+def parse_iso_date(value: str) -> Optional[date]:
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def parse_iso_datetime(value: str) -> datetime:
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return datetime.utcnow()
+
+
+def get_events_between(start: date, end: date) -> List[sqlite3.Row]:
+    return query_db(
+        LOCALIZED_ARTICLES_SELECT
+        + """
+        WHERE articles.event_date >= ? AND articles.event_date < ? AND articles.status = 'published'
+        ORDER BY articles.event_date, articles.id
+        """,
+        locale_params() + (start.isoformat(), end.isoformat()),
+    )
+
+
+@app.route("/events")
+def events():
+    view = request.args.get("view", "month")
+    if view not in EVENT_VIEWS:
+        view = "month"
+    today = datetime.utcnow().date()
+    anchor = parse_iso_date(request.args.get("date", "")) or today
+    # На краях діапазону date сусідні тижні/місяці вже не існують — сторінка падала б з 500
+    anchor = min(max(anchor, EVENT_MIN_DATE), EVENT_MAX_DATE)
+
+    if view == "week":
+        start = anchor - timedelta(days=anchor.weekday())
+        weeks = [[start + timedelta(days=offset) for offset in range(7)]]
+        prev_date = start - timedelta(days=7)
+        next_date = start + timedelta(days=7)
+        end = weeks[-1][-1]
+        heading = f"{start.strftime('%d.%m.%Y')} — {end.strftime('%d.%m.%Y')}"
+    else:
+        weeks = calendar.Calendar().monthdatescalendar(anchor.year, anchor.month)
+        first_of_month = anchor.replace(day=1)
+        prev_date = (first_of_month - timedelta(days=1)).replace(day=1)
+        next_date = (first_of_month + timedelta(days=31)).replace(day=1)
+        heading = f"{UKR_MONTHS[anchor.month - 1]} {anchor.year}"
+
+    events_by_day: Dict[str, List[sqlite3.Row]] = {}
+    for item in get_events_between(weeks[0][0], weeks[-1][-1] + timedelta(days=1)):
+        events_by_day.setdefault(item["event_date"], []).append(item)
+
+    calendar_weeks = [
+        [
+            {
+                "date": day,
+                "in_range": view == "week" or day.month == anchor.month,
+                "is_today": day == today,
+                "events": events_by_day.get(day.isoformat(), []),
+            }
+            for day in week
+        ]
+        for week in weeks
+    ]
+
+    return render_template(
+        "events.html",
+        view=view,
+        heading=heading,
+        weeks=calendar_weeks,
+        weekdays=UKR_WEEKDAYS,
+        anchor=anchor.isoformat(),
+        prev_date=prev_date.isoformat(),
+        next_date=next_date.isoformat(),
+        today=today.isoformat(),
+        active_title="Події",
+    )
+
+
+def ics_escape(value: str) -> str:
+    value = value.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,")
+    return value.replace("\r\n", "\\n").replace("\n", "\\n")
+
+
+def ics_fold(line: str) -> str:
+    # RFC 5545: рядки довші за 75 октетів переносяться з пробілом на початку
+    parts: List[str] = []
+    current = ""
+    size = 0
+    for ch in line:
+        ch_size = len(ch.encode("utf-8"))
+        if size + ch_size > 75:
+            parts.append(current)
+            current = " "
+            size = 1
+        current += ch
+        size += ch_size
+    parts.append(current)
+    return "\r\n".join(parts)
+
+
+def generate_events_ics(since: date) -> Iterator[str]:
+    rows = iter_db(
+        LOCALIZED_ARTICLES_SELECT
+        + """
+        WHERE articles.event_date >= ? AND articles.status = 'published'
+        ORDER BY articles.event_date, articles.id
+        """,
+        locale_params() + (since.isoformat(),),
+    )
+    host = urlsplit(site_root()).hostname or "localhost"
+    header = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        "PRODID:-//VPFK//Events//UK",
+        "CALSCALE:GREGORIAN",
+        "X-WR-CALNAME:Події ВПФК",
+    ]
+    yield "".join(ics_fold(line) + "\r\n" for line in header)
+    for row in rows:
+        event_day = parse_iso_date(row["event_date"])
+        if event_day is None:
+            continue
+        stamp = parse_iso_datetime(row["updated_at"])
+        link = row["external_link"] or external_url("article_detail", slug=row["slug"])
+        lines = [
+            "BEGIN:VEVENT",
+            f"UID:article-{row['id']}@{host}",
+            f"DTSTAMP:{stamp.strftime('%Y%m%dT%H%M%SZ')}",
+            f"DTSTART;VALUE=DATE:{event_day.strftime('%Y%m%d')}",
+            f"DTEND;VALUE=DATE:{(event_day + timedelta(days=1)).strftime('%Y%m%d')}",
+            f"SUMMARY:{ics_escape(row['title'])}",
+            f"DESCRIPTION:{ics_escape(row['summary'])}",
+            f"URL:{link}",
+            "END:VEVENT",
+        ]
+        yield "".join(ics_fold(line) + "\r\n" for line in lines)
+    yield "END:VCALENDAR\r\n"
+
+
+@app.route("/events.ics")
+def events_ics():
+    since = datetime.utcnow().date() - timedelta(days=ICS_PAST_DAYS)
+    # Календар за попередні дні вже не знадобиться
+    evict_cached(("articles",), lambda key: key[0] != "events.ics" or key[1] == since)
+    return cached_stream(
+        ("articles",),
+        external_cache_key(("events.ics", since)),
+        lambda: generate_events_ics(since),
+        "text/calendar",
+    )
+
+
+def get_feed_filters() -> Tuple[str, Optional[int]]:
+    category = request.args.get("category", "").strip()
+    if category and category not in ARTICLE_CATEGORIES:
+        abort(404)
+    section_id = request.args.get("section_id", "").strip()
+    if not section_id:
+        return category, None
+    if not section_id.isdigit() or not find_menu_item(get_menu_tree(), int(section_id)):
+        abort(404)
+    return category, int(section_id)
+
+
+def iter_feed_articles(category: str, section_id: Optional[int]) -> Iterator[sqlite3.Row]:
+    query = (
+        LOCALIZED_ARTICLES_SELECT
+        + """
+        WHERE articles.status = 'published'
+    """
+    )
+    params: List = list(locale_params())
+    if category:
+        query += " AND articles.category = ?"
+        params.append(category)
+    if section_id is not None:
+        section_ids = get_descendant_ids(section_id)
+        query += f" AND articles.section_id IN ({','.join('?' * len(section_ids))})"
+        params.extend(section_ids)
+    query += " ORDER BY articles.published_date DESC, articles.id DESC LIMIT ?"
+    params.append(FEED_LIMIT)
+    return iter_db(query, tuple(params))
+
+
+def feed_title(category: str, section_id: Optional[int]) -> str:
+    parts = ["ВПФК"]
+    if section_id is not None:
+        parts.append(find_menu_item(get_menu_tree(), section_id)["title"])
+    if category:
+        parts.append(category)
+    return " — ".join(parts)
+
+
+def article_link(row: sqlite3.Row) -> str:
+    return row["external_link"] or external_url("article_detail", slug=row["slug"])
+
+
+def generate_rss(category: str, section_id: Optional[int]) -> Iterator[str]:
+    site_url = external_url("index")
+    yield (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<rss version="2.0"><channel>'
+        f"<title>{escape(feed_title(category, section_id))}</title>"
+        f"<link>{escape(site_url)}</link>"
+        "<description>Новини, оголошення та події коледжу</description>"
+        f"<language>{g.locale}</language>\n"
+    )
+    for row in iter_feed_articles(category, section_id):
+        published = parse_iso_datetime(row["published_date"]).replace(tzinfo=timezone.utc)
+        yield (
+            "<item>"
+            f"<title>{escape(row['title'])}</title>"
+            f"<link>{escape(article_link(row))}</link>"
+            f"<guid isPermaLink=\"false\">article-{row['id']}</guid>"
+            f"<category>{escape(row['category'])}</category>"
+            f"<pubDate>{format_datetime(published)}</pubDate>"
+            f"<description>{escape(row['summary'])}</description>"
+            "</item>\n"
+        )
+    yield "</channel></rss>\n"
+
+
+def generate_atom(category: str, section_id: Optional[int]) -> Iterator[str]:
+    site_url = external_url("index")
+    feed_url = external_url("atom_feed", category=category or None, section_id=section_id)
+    updated = datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
+    yield (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        f'<feed xmlns="http://www.w3.org/2005/Atom" xml:lang="{g.locale}">'
+        f"<title>{escape(feed_title(category, section_id))}</title>"
+        f"<id>{escape(feed_url)}</id>"
+        f"<link href={quoteattr(site_url)} />"
+        f"<link rel=\"self\" href={quoteattr(feed_url)} />"
+        f"<updated>{updated}</updated>\n"
+    )
+    for row in iter_feed_articles(category, section_id):
+        entry_updated = parse_iso_datetime(row["updated_at"]).replace(microsecond=0).isoformat() + "Z"
+        yield (
+            "<entry>"
+            f"<title>{escape(row['title'])}</title>"
+            f"<id>{escape(external_url('article_detail_by_id', article_id=row['id']))}</id>"
+            f"<link href={quoteattr(article_link(row))} />"
+            f"<category term={quoteattr(row['category'])} />"
+            f"<updated>{entry_updated}</updated>"
+            f"<summary>{escape(row['summary'])}</summary>"
+            "</entry>\n"
+        )
+    yield "</feed>\n"
+
+
+@app.route("/feed.xml")
+def rss_feed():
+    category, section_id = get_feed_filters()
+    return cached_stream(
+        ("articles", "menu"),
+        external_cache_key(("feed.xml", category, section_id)),
+        lambda: generate_rss(category, section_id),
+        "application/rss+xml",
+    )
+
+
+@app.route("/atom.xml")
+def atom_feed():
+    category, section_id = get_feed_filters()
+    return cached_stream(
+        ("articles", "menu"),
+        external_cache_key(("atom.xml", category, section_id)),
+        lambda: generate_atom(category, section_id),
+        "application/atom+xml",
+    )
+
+
+def generate_sitemap() -> Iterator[str]:
+    yield '<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+    static_urls = [url_for("index"), url_for("admissions"), url_for("articles"), url_for("events")]
+    # Пункти меню зберігаються без мовного префікса, тому додаємо його так само, як url_for
+    menu_urls = [request.script_root + node["url"] for node in get_menu_flat() if node["url"].startswith("/")]
+    seen = set()
+    for path in static_urls + menu_urls:
+        if path in seen:
+            continue
+        seen.add(path)
+        yield f"<url><loc>{escape(site_root() + path)}</loc></url>\n"
+    for row in iter_db("SELECT slug, updated_at FROM articles WHERE status = 'published' ORDER BY id"):
+        loc = external_url("article_detail", slug=row["slug"])
+        lastmod = parse_iso_datetime(row["updated_at"]).date().isoformat()
+        yield f"<url><loc>{escape(loc)}</loc><lastmod>{lastmod}</lastmod></url>\n"
+    yield "</urlset>\n"
+
+
+@app.route("/sitemap.xml")
+def sitemap():
+    return cached_stream(
+        ("articles", "menu"),
+        external_cache_key(("sitemap.xml",)),
+        generate_sitemap,
+        "application/xml",
+        max_age=3600,
+    )
+
+
+def take_login_token(ip: str, username: str) -> float:
+    now = time.time()
+    subjects = {"ip": ip, "user": f"{username.lower()}@{ip}", "global": ""}
+    db = get_db()
+    db.execute("BEGIN IMMEDIATE")
+    try:
+        states = []
+        retry_after = 0.0
+        for prefix, capacity, rate in LOGIN_RATE_LIMITS:
+            key = f"{prefix}:{subjects[prefix]}"
+            row = db.execute("SELECT tokens, updated_at FROM login_buckets WHERE key = ?", (key,)).fetchone()
+            tokens = capacity if row is None else min(capacity, row["tokens"] + (now - row["updated_at"]) * rate)
+            if tokens < 1:
+                retry_after = max(retry_after, (1 - tokens) / rate)
+            states.append((key, tokens))
+        if not retry_after:
+            states = [(key, tokens - 1) for key, tokens in states]
+        db.executemany(
+            "INSERT OR REPLACE INTO login_buckets (key, tokens, updated_at) VALUES (?, ?, ?)",
+            [(key, tokens, now) for key, tokens in states],
+        )
+        db.execute("DELETE FROM login_buckets WHERE updated_at < ?", (now - LOGIN_BUCKET_TTL,))
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return retry_after
+
+
 @app.route("/login", methods=["GET", "POST"])
 def login():
     if request.method == "POST":
         username = request.form.get("username", "").strip()
         password = request.form.get("password", "")
+        retry_after = take_login_token(request.remote_addr or "", username)
+        if retry_after:
+            flash("Забагато спроб входу. Спробуйте пізніше.", "error")
+            response = app.make_response((render_template("login.html", active_title=""), 429))
+            response.headers["Retry-After"] = str(int(retry_after) + 1)
+            return response
         user = query_db("SELECT * FROM users WHERE username = ?", (username,), one=True)
-        if user and check_password_hash(user["password_hash"], password):
+        password_ok = check_password_hash(user["password_hash"] if user else DUMMY_PASSWORD_HASH, password)
+        if user and password_ok:
+            if user["password_hash"].split("$", 1)[0] != PASSWORD_HASH_PREFIX:
+                execute_db(
+                    "UPDATE users SET password_hash = ? WHERE id = ?",
+                    (hash_password(password), user["id"]),
+                )
             session["user_id"] = user["id"]
             flash("Вхід успішний.", "success")
             return redirect(url_for("admin_dashboard"))
@@ -617,8 +1965,195 @@ def login():
 
 @app.route("/images/<path:filename>")
 def legacy_images(filename: str):
-    images_dir = os.path.join(BASE_DIR, "images")
-    return send_from_directory(images_dir, filename)
+    return send_from_directory(IMAGES_DIR, filename)
+
+
+_image_digests: Dict[Tuple[str, int, int], str] = {}
+
+
+def image_source_digest(source_path: str) -> str:
+    stat = os.stat(source_path)
+    memo_key = (source_path, stat.st_mtime_ns, stat.st_size)
+    digest = _image_digests.get(memo_key)
+    if digest is None:
+        hasher = hashlib.sha256()
+        with open(source_path, "rb") as handle:
+            for block in iter(lambda: handle.read(65536), b""):
+                hasher.update(block)
+        digest = hasher.hexdigest()
+        _image_digests[memo_key] = digest
+    return digest
+
+
+def render_image_variant(source_path: str, width: int, height: int, fmt: str, target_path: str) -> None:
+    with Image.open(source_path) as original:
+        img = ImageOps.exif_transpose(original)
+        if height:
+            img = ImageOps.fit(img, (width, height), Image.LANCZOS)
+        else:
+            img.thumbnail((width, img.height), Image.LANCZOS)
+        if fmt == "jpeg":
+            if img.mode in ("RGBA", "LA", "P"):
+                img = img.convert("RGBA")
+                background = Image.new("RGB", img.size, (255, 255, 255))
+                background.paste(img, mask=img.getchannel("A"))
+                img = background
+            elif img.mode != "RGB":
+                img = img.convert("RGB")
+        elif img.mode not in ("RGB", "RGBA"):
+            img = img.convert("RGBA")
+
+        # Запис у тимчасовий файл і os.replace, щоб інші воркери не побачили половину файлу
+        os.makedirs(os.path.dirname(target_path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(target_path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                img.save(handle, format=fmt.upper(), quality=IMAGE_QUALITY, optimize=True)
+            os.replace(tmp_path, target_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+def prune_image_cache(keep: str) -> None:
+    files = []
+    total = 0
+    for root, _dirs, names in os.walk(IMAGE_CACHE_DIR):
+        for name in names:
+            path = os.path.join(root, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+    if total <= IMAGE_CACHE_MAX_BYTES:
+        return
+    files.sort()
+    for _mtime, size, path in files:
+        if path == keep:
+            continue
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+        if total <= IMAGE_CACHE_MAX_BYTES:
+            break
+
+
+def get_image_variant(source_path: str, width: int, height: int, fmt: str) -> str:
+    digest = image_source_digest(source_path)
+    name = f"{digest}-{width}x{height}.{'jpg' if fmt == 'jpeg' else fmt}"
+    target_path = os.path.join(IMAGE_CACHE_DIR, digest[:2], name)
+    if os.path.isfile(target_path):
+        # mtime слугує відміткою останнього використання для LRU-витіснення
+        os.utime(target_path)
+        return target_path
+    render_image_variant(source_path, width, height, fmt, target_path)
+    prune_image_cache(keep=target_path)
+    return target_path
+
+
+def resolve_image_source(filename: str) -> Optional[str]:
+    source_path = safe_join(IMAGES_DIR, filename)
+    if source_path is None or not os.path.isfile(source_path):
+        return None
+    if os.path.splitext(source_path)[1].lower() not in IMAGE_EXTENSIONS:
+        return None
+    return source_path
+
+
+@app.route("/img/<int:width>x<int:height>/<path:filename>")
+def image_variant(width: int, height: int, filename: str):
+    if (width, height) not in IMAGE_SIZES:
+        abort(404)
+    source_path = resolve_image_source(filename)
+    if source_path is None:
+        abort(404)
+    fmt = "webp" if "image/webp" in request.headers.get("Accept", "") else "jpeg"
+    variant_path = get_image_variant(source_path, width, height, fmt)
+    # Незмінним на рік є лише URL з поточним відбитком джерела; інші перевіряються через ETag
+    versioned = request.args.get("v") == image_source_digest(source_path)[:IMAGE_VERSION_LENGTH]
+    response = send_file(
+        variant_path,
+        mimetype=f"image/{fmt}",
+        max_age=31536000 if versioned else IMAGE_UNVERSIONED_MAX_AGE,
+        # Ім'я файлу вже містить відбиток джерела; mtime для ETag не годиться, бо його оновлює LRU
+        etag=os.path.basename(variant_path),
+    )
+    response.cache_control.public = True
+    response.cache_control.immutable = versioned
+    response.vary.add("Accept")
+    return response
+
+
+def image_url(filename: str, width: int, height: int = 0) -> str:
+    source_path = resolve_image_source(filename)
+    if source_path is None or (width, height) not in IMAGE_SIZES:
+        return url_for("legacy_images", filename=filename)
+    version = image_source_digest(source_path)[:IMAGE_VERSION_LENGTH]
+    return url_for("image_variant", width=width, height=height, filename=filename, v=version)
+
+
+@app.template_filter("with_images")
+def content_with_images(text: str) -> Markup:
+    # Рядок, що містить лише шлях /images/..., стає адаптивним зображенням: телефон отримує 320-640px,
+    # а не оригінал; решта тексту екранується як і раніше
+    lines = []
+    for line in (text or "").split("\n"):
+        match = CONTENT_IMAGE_RE.match(line)
+        source_path = resolve_image_source(match.group(1)) if match else None
+        if source_path is None:
+            lines.append(Markup.escape(line))
+            continue
+        filename = match.group(1)
+        srcset = ", ".join(f"{image_url(filename, width)} {width}w" for width in IMAGE_CONTENT_WIDTHS)
+        lines.append(
+            Markup(
+                '<img class="article-image" src="{}" srcset="{}" sizes="{}" alt="" loading="lazy" />'
+            ).format(image_url(filename, 960), srcset, IMAGE_CONTENT_SIZES)
+        )
+    return Markup("\n").join(lines)
+
+
+images_cli = AppGroup("images", help="Керування кешем зображень.")
+
+
+@images_cli.command("warm")
+def warm_images() -> None:
+    count = 0
+    for root, _dirs, names in os.walk(IMAGES_DIR):
+        for name in sorted(names):
+            filename = os.path.relpath(os.path.join(root, name), IMAGES_DIR)
+            source_path = resolve_image_source(filename)
+            if source_path is None:
+                continue
+            for width, height in IMAGE_WARM_SIZES:
+                for fmt in ("webp", "jpeg"):
+                    get_image_variant(source_path, width, height, fmt)
+                    count += 1
+    print(f"Підготовлено варіантів зображень: {count}")
+
+
+app.cli.add_command(images_cli)
+
+
+articles_cli = AppGroup("articles", help="Керування статтями.")
+
+
+@articles_cli.command("publish-due")
+def publish_due_command() -> None:
+    print(f"Опубліковано запланованих статей: {publish_due_articles()}")
+
+
+@articles_cli.command("compact-history")
+def compact_history_command() -> None:
+    revisions, audit_entries = compact_article_revisions()
+    print(f"Видалено ревізій: {revisions}, записів журналу дій: {audit_entries}")
+
+
+app.cli.add_command(articles_cli)
 
 
 @app.route("/logout")
@@ -634,6 +2169,60 @@ def admin_dashboard():
     return render_template("admin/dashboard.html", active_title="")
 
 
+def file_size(path: str) -> int:
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+@app.route("/debug/stats")
+@role_required("owner", "admin")
+def debug_stats():
+    # Лише пам'ять поточного воркера і stat() файлів — жодних запитів до БД
+    caches = {}
+    for scopes, (versions, entries) in _cache.items():
+        stats = _cache_stats.get(scopes, {"hits": 0, "misses": 0})
+        lookups = stats["hits"] + stats["misses"]
+        caches["+".join(scopes)] = {
+            "versions": list(versions),
+            "entries": len(entries),
+            "hits": stats["hits"],
+            "misses": stats["misses"],
+            "hit_ratio": round(stats["hits"] / lookups, 3) if lookups else None,
+        }
+    with load_shedder.lock:
+        shedding = {
+            "in_flight": load_shedder.in_flight,
+            "shed": load_shedder.shed_count,
+            "stale_served": load_shedder.stale_served,
+            "stale_entries": len(load_shedder.stale),
+            "stale_bytes": load_shedder.stale_bytes,
+        }
+    response = app.response_class(
+        json.dumps(
+            {
+                "pid": os.getpid(),
+                "uptime_seconds": round(time.time() - STARTED_AT),
+                "caches": caches,
+                "load_shedding": shedding,
+                "image_digests": len(_image_digests),
+                "db": {
+                    "size": file_size(DB_PATH),
+                    "wal_size": file_size(DB_PATH + "-wal"),
+                    "journal_size": file_size(DB_PATH + "-journal"),
+                    "schema_version": SCHEMA_VERSION,
+                },
+            },
+            ensure_ascii=False,
+            indent=2,
+        ),
+        mimetype="application/json",
+    )
+    response.headers["Cache-Control"] = "no-store"
+    return response
+
+
 @app.route("/admin/users")
 @role_required("owner", "admin")
 def admin_users():
@@ -656,14 +2245,18 @@ def admin_user_new():
         elif not username or not password:
             flash("Заповніть логін і пароль.", "error")
         else:
+            # Хеш рахуємо до транзакції, щоб не тримати блокування запису на час scrypt
+            password_hash = hash_password(password)
             try:
-                execute_db(
-                    """
-                    INSERT INTO users (username, password_hash, role, created_at)
-                    VALUES (?, ?, ?, ?)
-                    """,
-                    (username, generate_password_hash(password), role, datetime.utcnow().isoformat()),
-                )
+                with db_transaction():
+                    new_id = execute_db(
+                        """
+                        INSERT INTO users (username, password_hash, role, created_at)
+                        VALUES (?, ?, ?, ?)
+                        """,
+                        (username, password_hash, role, datetime.utcnow().isoformat()),
+                    )
+                    audit("user.create", "user", new_id, f"{username} ({role})")
                 flash("Користувача створено.", "success")
                 return redirect(url_for("admin_users"))
             except sqlite3.IntegrityError:
@@ -695,14 +2288,22 @@ def admin_user_edit(user_id: int):
         else:
             if role not in roles and g.user["id"] != user["id"]:
                 role = user["role"]
-            execute_db(
-                "UPDATE users SET username = ?, role = ? WHERE id = ?",
-                (username, role, user_id),
-            )
-            if password:
+            password_hash = hash_password(password) if password else None
+            with db_transaction():
                 execute_db(
-                    "UPDATE users SET password_hash = ? WHERE id = ?",
-                    (generate_password_hash(password), user_id),
+                    "UPDATE users SET username = ?, role = ? WHERE id = ?",
+                    (username, role, user_id),
+                )
+                if password_hash:
+                    execute_db(
+                        "UPDATE users SET password_hash = ? WHERE id = ?",
+                        (password_hash, user_id),
+                    )
+                audit(
+                    "user.update",
+                    "user",
+                    user_id,
+                    f"{username} ({role})" + (", пароль змінено" if password else ""),
                 )
             flash("Дані користувача оновлено.", "success")
             return redirect(url_for("admin_users"))
@@ -721,7 +2322,9 @@ def admin_user_delete(user_id: int):
         return redirect(url_for("admin_users"))
     if not can_manage_user(g.user, user):
         abort(403)
-    execute_db("DELETE FROM users WHERE id = ?", (user_id,))
+    with db_transaction():
+        execute_db("DELETE FROM users WHERE id = ?", (user_id,))
+        audit("user.delete", "user", user_id, user["username"])
     flash("Користувача видалено.", "success")
     return redirect(url_for("admin_users"))
 
@@ -729,14 +2332,14 @@ def admin_user_delete(user_id: int):
 @app.route("/admin/menu")
 @role_required("owner", "admin", "editor")
 def admin_menu():
-    items = get_menu_flat()
+    items = get_menu_flat(DEFAULT_LOCALE)
     return render_template("admin/menu.html", items=items, active_title="")
 
 
 @app.route("/admin/menu/new", methods=["GET", "POST"])
 @role_required("owner", "admin", "editor")
 def admin_menu_new():
-    parents = get_menu_flat()
+    parents = get_menu_flat(DEFAULT_LOCALE)
     if request.method == "POST":
         title = request.form.get("title", "").strip()
         url_value = request.form.get("url", "").strip() or "#"
@@ -746,16 +2349,27 @@ def admin_menu_new():
         if not title:
             flash("Назва обов'язкова.", "error")
         else:
-            execute_db(
-                """
-                INSERT INTO menu_items (parent_id, title, url, sort_order)
-                VALUES (?, ?, ?, ?)
-                """,
-                (parent_id, title, url_value, sort_order),
-            )
+            with db_transaction():
+                new_id = execute_db(
+                    """
+                    INSERT INTO menu_items (parent_id, title, url, sort_order)
+                    VALUES (?, ?, ?, ?)
+                    """,
+                    (parent_id, title, url_value, sort_order),
+                )
+                save_translations("menu_item_translations", "menu_item_id", new_id, read_translations(["title"]))
+                bump_cache_version("menu")
+                audit("menu.create", "menu_item", new_id, f"{title} → {url_value}")
             flash("Пункт меню створено.", "success")
             return redirect(url_for("admin_menu"))
-    return render_template("admin/menu_form.html", item=None, parents=parents, active_title="")
+    return render_template(
+        "admin/menu_form.html",
+        item=None,
+        parents=parents,
+        translation_locales=TRANSLATION_LOCALES,
+        translations={},
+        active_title="",
+    )
 
 
 @app.route("/admin/menu/<int:item_id>/edit", methods=["GET", "POST"])
@@ -764,7 +2378,7 @@ def admin_menu_edit(item_id: int):
     item = query_db("SELECT * FROM menu_items WHERE id = ?", (item_id,), one=True)
     if not item:
         abort(404)
-    parents = [row for row in get_menu_flat() if row["id"] != item_id]
+    parents = [row for row in get_menu_flat(DEFAULT_LOCALE) if row["id"] != item_id]
     if request.method == "POST":
         title = request.form.get("title", "").strip()
         url_value = request.form.get("url", "").strip() or "#"
@@ -774,17 +2388,28 @@ def admin_menu_edit(item_id: int):
         if not title:
             flash("Назва обов'язкова.", "error")
         else:
-            execute_db(
-                """
-                UPDATE menu_items
-                SET parent_id = ?, title = ?, url = ?, sort_order = ?
-                WHERE id = ?
-                """,
-                (parent_id, title, url_value, sort_order, item_id),
-            )
+            with db_transaction():
+                execute_db(
+                    """
+                    UPDATE menu_items
+                    SET parent_id = ?, title = ?, url = ?, sort_order = ?
+                    WHERE id = ?
+                    """,
+                    (parent_id, title, url_value, sort_order, item_id),
+                )
+                save_translations("menu_item_translations", "menu_item_id", item_id, read_translations(["title"]))
+                bump_cache_version("menu")
+                audit("menu.update", "menu_item", item_id, f"{title} → {url_value}")
             flash("Пункт меню оновлено.", "success")
             return redirect(url_for("admin_menu"))
-    return render_template("admin/menu_form.html", item=item, parents=parents, active_title="")
+    return render_template(
+        "admin/menu_form.html",
+        item=item,
+        parents=parents,
+        translation_locales=TRANSLATION_LOCALES,
+        translations=load_translations("menu_item_translations", "menu_item_id", item_id),
+        active_title="",
+    )
 
 
 @app.route("/admin/menu/<int:item_id>/delete", methods=["POST"])
@@ -793,7 +2418,17 @@ def admin_menu_delete(item_id: int):
     item = query_db("SELECT * FROM menu_items WHERE id = ?", (item_id,), one=True)
     if not item:
         abort(404)
-    execute_db("DELETE FROM menu_items WHERE id = ? OR parent_id = ?", (item_id, item_id))
+    with db_transaction():
+        execute_db(
+            """
+            DELETE FROM menu_item_translations
+            WHERE menu_item_id IN (SELECT id FROM menu_items WHERE id = ? OR parent_id = ?)
+            """,
+            (item_id, item_id),
+        )
+        execute_db("DELETE FROM menu_items WHERE id = ? OR parent_id = ?", (item_id, item_id))
+        bump_cache_version("menu")
+        audit("menu.delete", "menu_item", item_id, item["title"])
     flash("Пункт меню видалено.", "success")
     return redirect(url_for("admin_menu"))
 
@@ -801,26 +2436,85 @@ def admin_menu_delete(item_id: int):
 @app.route("/admin/articles")
 @role_required("owner", "admin", "editor")
 def admin_articles():
-    articles = query_db(
+    articles = iter_db(
         """
-        SELECT articles.*, menu_items.title AS section_title
+        SELECT articles.id, articles.title, articles.category, articles.status, articles.publish_at,
+               articles.published_date, articles.event_date, menu_items.title AS section_title
         FROM articles
         LEFT JOIN menu_items ON menu_items.id = articles.section_id
-        ORDER BY published_date DESC
+        ORDER BY articles.published_date DESC
         """
     )
-    return render_template(
+    return stream_listing(
         "admin/articles.html",
         articles=articles,
         categories=ARTICLE_CATEGORIES,
+        statuses=dict(ARTICLE_STATUSES),
         active_title="",
     )
 
 
+def read_translations(fields: List[str]) -> Dict[str, Dict[str, Optional[str]]]:
+    return {
+        locale: {field: request.form.get(f"{field}_{locale}", "").strip() or None for field in fields}
+        for locale in TRANSLATION_LOCALES
+    }
+
+
+def load_translations(table: str, key_column: str, key: int) -> Dict[str, sqlite3.Row]:
+    rows = query_db(f"SELECT * FROM {table} WHERE {key_column} = ?", (key,))
+    return {row["locale"]: row for row in rows}
+
+
+def save_translations(table: str, key_column: str, key: int, translations: Dict[str, Dict[str, Optional[str]]]) -> None:
+    for locale, values in translations.items():
+        # Переклад без назви вважається відсутнім — сторінка показує українську версію
+        if not values["title"]:
+            execute_db(f"DELETE FROM {table} WHERE {key_column} = ? AND locale = ?", (key, locale))
+            continue
+        fields = list(values)
+        updates = ", ".join(f"{field} = excluded.{field}" for field in fields)
+        execute_db(
+            f"""
+            INSERT INTO {table} ({key_column}, locale, {", ".join(fields)})
+            VALUES (?, ?, {", ".join("?" * len(fields))})
+            ON CONFLICT({key_column}, locale) DO UPDATE SET {updates}
+            """,
+            (key, locale) + tuple(values[field] for field in fields),
+        )
+
+
+def update_article_slug(article: sqlite3.Row, title: str) -> str:
+    if slugify_uk(title) == slugify_uk(article["title"]):
+        return article["slug"]
+    slug = unique_article_slug(get_db().cursor(), title, exclude_id=article["id"])
+    # Старий слаг лишається доступним як 301 на новий
+    execute_db("DELETE FROM article_redirects WHERE slug = ?", (slug,))
+    execute_db(
+        "INSERT OR REPLACE INTO article_redirects (slug, article_id) VALUES (?, ?)",
+        (article["slug"], article["id"]),
+    )
+    return slug
+
+
+def read_publication_form() -> Tuple[Optional[str], Optional[str]]:
+    status = request.form.get("status", "published")
+    if status not in dict(ARTICLE_STATUSES):
+        status = "published"
+    publish_at = request.form.get("publish_at", "").strip() or None
+    if status != "scheduled":
+        return status, None
+    if not publish_at:
+        return None, None
+    if publish_at <= datetime.now().isoformat(timespec="minutes"):
+        return "published", publish_at
+    return status, publish_at
+
+
 @app.route("/admin/articles/new", methods=["GET", "POST"])
 @role_required("owner", "admin", "editor")
 def admin_article_new():
-    sections = get_menu_flat()
+    sections = get_menu_flat(DEFAULT_LOCALE)
     if request.method == "POST":
         title = request.form.get("title", "").strip()
         summary = request.form.get("summary", "").strip()
@@ -828,32 +2522,51 @@ def admin_article_new():
         category = request.form.get("category", ARTICLE_CATEGORIES[0])
         section_id = request.form.get("section_id") or None
         section_id = int(section_id) if section_id else None
-        published_date = request.form.get("published_date") or datetime.utcnow().date().isoformat()
+        published_date = request.form.get("published_date") or (
+            request.form.get("publish_at", "")[:10] or datetime.utcnow().date().isoformat()
+        )
         event_date = request.form.get("event_date") or None
         external_link = request.form.get("external_link", "").strip() or None
+        status, publish_at = read_publication_form()
 
         if not title or not summary or not content:
             flash("Заповніть назву, опис та текст статті.", "error")
+        elif status is None:
+            flash("Вкажіть дату й час публікації для запланованої статті.", "error")
         else:
-            execute_db(
-                """
-                INSERT INTO articles
-                (title, summary, content, category, section_id, published_date, event_date, external_link, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    title,
-                    summary,
-                    content,
-                    category,
-                    section_id,
-                    published_date,
-                    event_date,
-                    external_link,
-                    datetime.utcnow().isoformat(),
-                    datetime.utcnow().isoformat(),
-                ),
-            )
+            with db_transaction():
+                slug = unique_article_slug(get_db().cursor(), title)
+                execute_db("DELETE FROM article_redirects WHERE slug = ?", (slug,))
+                new_id = execute_db(
+                    """
+                    INSERT INTO articles
+                    (title, slug, summary, content, category, section_id, published_date, event_date, external_link,
+                     status, publish_at, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        title,
+                        slug,
+                        summary,
+                        content,
+                        category,
+                        section_id,
+                        published_date,
+                        event_date,
+                        external_link,
+                        status,
+                        publish_at,
+                        datetime.utcnow().isoformat(),
+                        datetime.utcnow().isoformat(),
+                    ),
+                )
+                save_translations(
+                    "article_translations", "article_id", new_id, read_translations(["title", "summary", "content"])
+                )
+                bump_cache_version("articles")
+                created = query_db("SELECT * FROM articles WHERE id = ?", (new_id,), one=True)
+                record_article_revision(new_id, article_state(created))
+                audit("article.create", "article", new_id, title)
             flash("Статтю створено.", "success")
             return redirect(url_for("admin_articles"))
 
@@ -862,6 +2575,9 @@ def admin_article_new():
         article=None,
         sections=sections,
         categories=ARTICLE_CATEGORIES,
+        statuses=ARTICLE_STATUSES,
+        translation_locales=TRANSLATION_LOCALES,
+        translations={},
         active_title="",
     )
 
@@ -872,7 +2588,7 @@ def admin_article_edit(article_id: int):
     article = query_db("SELECT * FROM articles WHERE id = ?", (article_id,), one=True)
     if not article:
         abort(404)
-    sections = get_menu_flat()
+    sections = get_menu_flat(DEFAULT_LOCALE)
     if request.method == "POST":
         title = request.form.get("title", "").strip()
         summary = request.form.get("summary", "").strip()
@@ -880,33 +2596,51 @@ def admin_article_edit(article_id: int):
         category = request.form.get("category", ARTICLE_CATEGORIES[0])
         section_id = request.form.get("section_id") or None
         section_id = int(section_id) if section_id else None
-        published_date = request.form.get("published_date") or datetime.utcnow().date().isoformat()
+        published_date = request.form.get("published_date") or (
+            request.form.get("publish_at", "")[:10] or datetime.utcnow().date().isoformat()
+        )
         event_date = request.form.get("event_date") or None
         external_link = request.form.get("external_link", "").strip() or None
+        status, publish_at = read_publication_form()
 
         if not title or not summary or not content:
             flash("Заповніть назву, опис та текст статті.", "error")
+        elif status is None:
+            flash("Вкажіть дату й час публікації для запланованої статті.", "error")
         else:
-            execute_db(
-                """
-                UPDATE articles
-                SET title = ?, summary = ?, content = ?, category = ?, section_id = ?,
-                    published_date = ?, event_date = ?, external_link = ?, updated_at = ?
-                WHERE id = ?
-                """,
-                (
-                    title,
-                    summary,
-                    content,
-                    category,
-                    section_id,
-                    published_date,
-                    event_date,
-                    external_link,
-                    datetime.utcnow().isoformat(),
-                    article_id,
-                ),
-            )
+            with db_transaction():
+                slug = update_article_slug(article, title)
+                execute_db(
+                    """
+                    UPDATE articles
+                    SET title = ?, slug = ?, summary = ?, content = ?, category = ?, section_id = ?,
+                        published_date = ?, event_date = ?, external_link = ?, status = ?, publish_at = ?,
+                        updated_at = ?
+                    WHERE id = ?
+                    """,
+                    (
+                        title,
+                        slug,
+                        summary,
+                        content,
+                        category,
+                        section_id,
+                        published_date,
+                        event_date,
+                        external_link,
+                        status,
+                        publish_at,
+                        datetime.utcnow().isoformat(),
+                        article_id,
+                    ),
+                )
+                save_translations(
+                    "article_translations", "article_id", article_id, read_translations(["title", "summary", "content"])
+                )
+                bump_cache_version("articles")
+                updated = query_db("SELECT * FROM articles WHERE id = ?", (article_id,), one=True)
+                record_article_revision(article_id, article_state(updated), previous=article_state(article))
+                audit("article.update", "article", article_id, title)
             flash("Статтю оновлено.", "success")
             return redirect(url_for("admin_articles"))
 
@@ -915,6 +2649,82 @@ def admin_article_edit(article_id: int):
         article=article,
         sections=sections,
         categories=ARTICLE_CATEGORIES,
+        statuses=ARTICLE_STATUSES,
+        translation_locales=TRANSLATION_LOCALES,
+        translations=load_translations("article_translations", "article_id", article_id),
+        active_title="",
+    )
+
+
+@app.route("/admin/articles/<int:article_id>/revisions")
+@role_required("owner", "admin", "editor")
+def admin_article_revisions(article_id: int):
+    article = query_db("SELECT * FROM articles WHERE id = ?", (article_id,), one=True)
+    if not article:
+        abort(404)
+    revisions = query_db(
+        """
+        SELECT article_revisions.revision, article_revisions.is_snapshot, article_revisions.created_at,
+               length(article_revisions.payload) AS size, users.username
+        FROM article_revisions
+        LEFT JOIN users ON users.id = article_revisions.user_id
+        WHERE article_revisions.article_id = ?
+        ORDER BY article_revisions.revision DESC
+        """,
+        (article_id,),
+    )
+    selected = request.args.get("revision", type=int)
+    state = load_article_revision(article_id, selected) if selected else None
+    return render_template(
+        "admin/article_revisions.html",
+        article=article,
+        revisions=revisions,
+        selected=selected if state else None,
+        state=state,
+        fields=REVISION_FIELDS,
+        active_title="",
+    )
+
+
+@app.route("/admin/articles/<int:article_id>/revisions/<int:revision>/restore", methods=["POST"])
+@role_required("owner", "admin", "editor")
+def admin_article_restore(article_id: int, revision: int):
+    article = query_db("SELECT * FROM articles WHERE id = ?", (article_id,), one=True)
+    if not article:
+        abort(404)
+    state = load_article_revision(article_id, revision)
+    if not state:
+        abort(404)
+    with db_transaction():
+        slug = update_article_slug(article, state["title"])
+        assignments = ", ".join(f"{field} = ?" for field in REVISION_FIELDS)
+        execute_db(
+            f"UPDATE articles SET {assignments}, slug = ?, updated_at = ? WHERE id = ?",
+            tuple(state[field] for field in REVISION_FIELDS) + (slug, datetime.utcnow().isoformat(), article_id),
+        )
+        bump_cache_version("articles")
+        record_article_revision(article_id, state, previous=article_state(article))
+        audit("article.restore", "article", article_id, f"{state['title']} (ревізія {revision})")
+    flash(f"Статтю відновлено з ревізії {revision}.", "success")
+    return redirect(url_for("admin_article_revisions", article_id=article_id))
+
+
+@app.route("/admin/audit")
+@role_required("owner", "admin")
+def admin_audit():
+    user_id = request.args.get("user_id", type=int)
+    query = "SELECT * FROM audit_log"
+    params: List = []
+    if user_id:
+        query += " WHERE user_id = ?"
+        params.append(user_id)
+    query += " ORDER BY created_at DESC LIMIT ?"
+    params.append(AUDIT_PAGE_SIZE)
+    return render_template(
+        "admin/audit.html",
+        entries=query_db(query, tuple(params)),
+        users=query_db("SELECT id, username FROM users ORDER BY username"),
+        selected_user=user_id,
         active_title="",
     )
 
@@ -925,10 +2735,138 @@ def admin_article_delete(article_id: int):
     article = query_db("SELECT * FROM articles WHERE id = ?", (article_id,), one=True)
     if not article:
         abort(404)
-    execute_db("DELETE FROM articles WHERE id = ?", (article_id,))
+    with db_transaction():
+        execute_db("DELETE FROM article_redirects WHERE article_id = ?", (article_id,))
+        execute_db("DELETE FROM article_translations WHERE article_id = ?", (article_id,))
+        execute_db("DELETE FROM articles WHERE id = ?", (article_id,))
+        bump_cache_version("articles")
+        audit("article.delete", "article", article_id, article["title"])
     flash("Статтю видалено.", "success")
     return redirect(url_for("admin_articles"))
 
 
+def verify_database(path: str) -> None:
+    conn = sqlite3.connect(path)
+    try:
+        result = conn.execute("PRAGMA integrity_check").fetchone()[0]
+    finally:
+        conn.close()
+    if result != "ok":
+        raise click.ClickException(f"Перевірка цілісності {path} не пройдена: {result}")
+
+
+def create_backup(label: str = "", rotate: bool = True) -> str:
+    os.makedirs(BACKUP_DIR, exist_ok=True)
+    # Мікросекунди: дві копії за одну секунду не перезаписують одна одну
+    stamp = datetime.utcnow().strftime("%Y%m%d-%H%M%S-%f")
+    name = f"app-{stamp}{'-' + label if label else ''}.db.gz"
+    fd, raw_path = tempfile.mkstemp(dir=BACKUP_DIR, suffix=".db")
+    os.close(fd)
+    try:
+        source = sqlite3.connect(DB_PATH)
+        target = sqlite3.connect(raw_path)
+        try:
+            # Один крок — один знімок читання. У WAL він не блокує запис воркерів, а покрокове копіювання
+            # починалося б заново після кожного чужого запису
+            source.backup(target)
+        finally:
+            target.close()
+            source.close()
+        verify_database(raw_path)
+
+        archive_path = os.path.join(BACKUP_DIR, name)
+        with open(raw_path, "rb") as raw, gzip.open(archive_path + ".tmp", "wb") as packed:
+            shutil.copyfileobj(raw, packed)
+        os.replace(archive_path + ".tmp", archive_path)
+    finally:
+        os.unlink(raw_path)
+    if rotate:
+        rotate_backups()
+    return archive_path
+
+
+def list_backups() -> List[str]:
+    return sorted(glob.glob(os.path.join(BACKUP_DIR, "app-*.db.gz")))
+
+
+def rotate_backups() -> None:
+    backups = list_backups()
+    for path in backups[: max(len(backups) - BACKUP_KEEP, 0)]:
+        os.unlink(path)
+
+
+def restore_backup(archive_path: str) -> None:
+    fd, raw_path = tempfile.mkstemp(dir=DATA_DIR, suffix=".db")
+    os.close(fd)
+    try:
+        with gzip.open(archive_path, "rb") as packed, open(raw_path, "wb") as raw:
+            shutil.copyfileobj(packed, raw)
+        verify_database(raw_path)
+
+        live = sqlite3.connect(DB_PATH, timeout=30)
+        try:
+            versions = dict(live.execute("SELECT scope, version FROM cache_versions").fetchall())
+            restored = sqlite3.connect(raw_path)
+            try:
+                # Нові версії кешу більші за поточні, тож воркери не віддадуть сторінки зі старої бази
+                for scope in CACHE_SCOPES:
+                    restored.execute(
+                        """
+                        INSERT INTO cache_versions (scope, version) VALUES (?, ?)
+                        ON CONFLICT(scope) DO UPDATE SET version = MAX(version, excluded.version)
+                        """,
+                        (scope, versions.get(scope, 0) + 1),
+                    )
+                restored.commit()
+            finally:
+                restored.close()
+
+            # Копіюємо сторінки через рушій SQLite: відкриті з'єднання воркерів бачать нову базу
+            # під звичайним блокуванням, а файл (і його inode) лишається тим самим
+            restored = sqlite3.connect(raw_path)
+            try:
+                # Блокування запису на live тримається до кінця копіювання, тож робимо його одним кроком
+                restored.backup(live)
+            finally:
+                restored.close()
+        finally:
+            live.close()
+    finally:
+        if os.path.exists(raw_path):
+            os.unlink(raw_path)
+
+
+db_cli = AppGroup("db", help="Резервні копії бази даних.")
+
+
+@db_cli.command("backup")
+def backup_command() -> None:
+    print(f"Резервну копію створено: {create_backup()}")
+
+
+@db_cli.command("list")
+def list_backups_command() -> None:
+    for path in list_backups():
+        print(f"{path}  {os.path.getsize(path) // 1024} КБ")
+
+
+@db_cli.command("restore")
+@click.argument("archive", required=False)
+def restore_command(archive: Optional[str]) -> None:
+    backups = list_backups()
+    if archive is None:
+        if not backups:
+            raise click.ClickException("Резервних копій не знайдено.")
+        archive = backups[-1]
+    if not os.path.isfile(archive):
+        raise click.ClickException(f"Файл не знайдено: {archive}")
+    safety_copy = create_backup("pre-restore", rotate=False)
+    restore_backup(archive)
+    print(f"Базу відновлено з {archive}. Попередній стан збережено в {safety_copy}")
+
+
+app.cli.add_command(db_cli)
+
+
 if __name__ == "__main__":
     app.run(debug=True)
@@ -0,0 +1,72 @@
+
+# Навантажувальна перевірка обмеження /login: затримка публічної сторінки до і під час потоку входів.
+#
+#   gunicorn --bind 127.0.0.1:5077 --workers 4 app:app
+#   python scripts/login_flood.py --threads 16
+#   python scripts/login_flood.py --threads 16 --username owner
+from __future__ import annotations
+
+import argparse
+import statistics
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from typing import List, Optional
+
+
+def flood(base: str, worker: int, username: Optional[str], stop: threading.Event) -> None:
+    attempt = 0
+    while not stop.is_set():
+        data = urllib.parse.urlencode(
+            {"username": username or f"u{worker}-{attempt}", "password": "wrong"}
+        ).encode("utf-8")
+        try:
+            urllib.request.urlopen(base + "/login", data=data, timeout=30).read()
+        except (urllib.error.URLError, OSError):
+            # 429 теж потрапляє сюди — для потоку це очікувано
+            pass
+        attempt += 1
+
+
+def measure(base: str, path: str, samples: int) -> List[float]:
+    latencies = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        urllib.request.urlopen(base + path, timeout=60).read()
+        latencies.append((time.perf_counter() - started) * 1000)
+    return sorted(latencies)
+
+
+def report(label: str, latencies: List[float]) -> None:
+    p95 = latencies[int(len(latencies) * 0.95)]
+    print(f"{label}: p50={statistics.median(latencies):.1f} мс p95={p95:.1f} мс")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--base", default="http://127.0.0.1:5077")
+    parser.add_argument("--path", default="/articles")
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--samples", type=int, default=40)
+    parser.add_argument("--username", help="один логін для всіх спроб; типово щоразу новий")
+    args = parser.parse_args()
+
+    report("без навантаження", measure(args.base, args.path, args.samples))
+    stop = threading.Event()
+    threads = [
+        threading.Thread(target=flood, args=(args.base, worker, args.username, stop), daemon=True)
+        for worker in range(args.threads)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(2)
+    try:
+        report("потік входів", measure(args.base, args.path, args.samples))
+    finally:
+        stop.set()
+
+
+if __name__ == "__main__":
+    main()